@@ -0,0 +1,25 @@
+# cython: language_level=3
+"""
+_repair.pyx - Compiled line loop for complete_markers.py YAML repairs
+
+Build in place with `cythonize -i tools/_repair.pyx`. complete_markers.py
+falls back to its pure-Python loop when this extension is not importable.
+"""
+
+
+cpdef str fix_bare_keys(str content, object key_match):
+    """Append a colon to lines that look like keys without one"""
+    cdef list lines = content.split('\n')
+    cdef Py_ssize_t i
+    cdef str line, stripped
+
+    for i in range(len(lines)):
+        line = <str>lines[i]
+        stripped = line.strip()
+        # Fix lines that look like headers without colons
+        if stripped and not stripped.startswith('-') and ':' not in line:
+            # Check if it looks like a key (alphanumeric with underscores)
+            if key_match(stripped) is not None:
+                lines[i] = line.rstrip() + ':'
+
+    return '\n'.join(lines)
@@ -12,19 +12,65 @@ import os
 import sys
 import json
 import logging
-import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Callable, Iterable
+
+# Prefer the libyaml-backed loader/dumper; fall back to pure Python
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper  # type: ignore[assignment]
+
+# Prefer orjson for the quarantine error reports when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Prefer the linear-time RE2 engine for the scanning passes when installed;
+# the patterns below only use features both engines support, with flags inline.
+# RE2's \s is only [\t\n\f\r ] (no \v, \x85, U+2028, ...), so whitespace is
+# spelled out as an explicit class instead
+try:
+    import re2 as re  # type: ignore[import-not-found, import-untyped]
+except ImportError:
+    import re
+
+# Every character str.isspace() (and so str.strip()) treats as whitespace,
+# which is what stdlib re's \s matches; _HSPACE is the same without \n
+_HSPACE = '\t\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+_SPACE = '\n' + _HSPACE
+
+# Patterns used by the repair pass, compiled once per process
+_KEY_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+_ARRAY_RE = re.compile(f'(?m)^[{_SPACE}]*-[{_SPACE}]*"(.+)"$')
+_BARE_KEY_LINE_RE = re.compile(f'(?m)^[{_HSPACE}]*[a-zA-Z_][a-zA-Z0-9_]*[{_HSPACE}]*$')
+
+# Patterns used by the flat fallback parser: a key line is a non-comment,
+# non-list line containing a colon; any other non-blank, non-comment line
+# continues the value of the preceding key
+_KV_LINE_RE = re.compile(f'(?m)^[{_HSPACE}]*([^{_SPACE}#\\-:][^:\\n]*|):(.*)$')
+_CONTINUATION_RE = re.compile(f'(?m)^[{_HSPACE}]*([^{_SPACE}#].*)$')
+
+# Marker name prefixes that identify named-entity markers
+_ENTITY_PREFIXES = ('A_LOC', 'A_PER', 'A_ORG')
+
+# Code points JSON leaves raw but YAML rejects or folds inside double quotes
+_YAML_ESCAPES = {
+    c: f'\\u{c:04x}'
+    for c in (*range(0x7f, 0xa0), 0x2028, 0x2029, 0xfeff, 0xfffe, 0xffff)
+}
 
 # Configuration Section
-CONFIG = {
+CONFIG: Dict[str, Any] = {
     'MARKER_DIR': 'marker',
     'OUTPUT_DIR': 'final_marker_set',
     'QUARANTINE': 'quarantine',
     'SUMMARY_LOG': 'tools/normalize_report.tsv',
     'MIN_EXAMPLES': 5,
-    'LOG_LEVEL': 'INFO',
+    'LOG_LEVEL': 'WARNING',  # INFO/DEBUG add per-file progress messages
     'LOG_FILE': 'tools/complete_markers.log'
 }
 
@@ -33,13 +79,35 @@ logging.basicConfig(
     level=getattr(logging, CONFIG['LOG_LEVEL']),
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(CONFIG['LOG_FILE']),
+        logging.FileHandler(CONFIG['LOG_FILE'], delay=True),  # opened on first record
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
 
+def _fix_bare_keys_py(content: str, key_match: Callable[[str], Any]) -> str:
+    """Append a colon to lines that look like keys without one"""
+    lines = content.split('\n')
+    
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        # Fix lines that look like headers without colons
+        if stripped and not stripped.startswith('-') and ':' not in line:
+            # Check if it looks like a key (alphanumeric with underscores)
+            if key_match(stripped):
+                lines[i] = line.rstrip() + ':'
+    
+    return '\n'.join(lines)
+
+
+# Use the compiled line loop from tools/_repair.pyx when it has been built
+try:
+    from _repair import fix_bare_keys as _fix_bare_keys  # type: ignore[import-not-found, import-untyped]
+except ImportError:
+    _fix_bare_keys = _fix_bare_keys_py
+
+
 class YAMLRepairer:
     """Handles YAML syntax error recovery"""
     
@@ -53,74 +121,75 @@ class YAMLRepairer:
         content = content.replace('\t', '  ')
         
         # Fix missing colons in headers
-        lines = content.split('\n')
-        repaired_lines = []
-        
-        for line in lines:
-            # Fix lines that look like headers without colons
-            if line.strip() and not line.strip().startswith('-') and ':' not in line:
-                # Check if it looks like a key (alphanumeric with underscores)
-                if re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', line.strip()):
-                    line = line.rstrip() + ':'
-            repaired_lines.append(line)
-        
-        content = '\n'.join(repaired_lines)
+        content = _fix_bare_keys(content, _KEY_RE.match)
         
         # Fix common YAML array issues
-        content = re.sub(r'^\s*-\s*"(.+)"$', r'  - "\1"', content, flags=re.MULTILINE)
+        content = _ARRAY_RE.sub(r'  - "\1"', content)
         
         return content
     
     @staticmethod
-    def parse_with_recovery(file_path: str) -> Tuple[Optional[Dict], Optional[str]]:
+    def is_repairable(content: str) -> bool:
+        """Check whether repair_yaml_content would change anything at all"""
+        return ('---' in content or '\t' in content
+                or _BARE_KEY_LINE_RE.search(content) is not None
+                or _ARRAY_RE.search(content) is not None)
+    
+    @staticmethod
+    def parse_with_recovery(file_path: str) -> Tuple[Any, Optional[str]]:
         """Try multiple strategies to parse YAML file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            f = open(file_path, 'rb')
         except Exception as e:
             return None, f"Failed to read file: {str(e)}"
         
-        # Strategy 1: Try parsing as-is
-        try:
-            data = yaml.safe_load(content)
-            if data:
-                return data, None
-        except yaml.YAMLError:
-            pass
+        with f:
+            # Strategy 1: Try parsing as-is, streaming from the file handle
+            try:
+                data = yaml.load(f, Loader=_Loader)
+                if data:
+                    return data, None
+            except yaml.YAMLError:
+                pass
+            
+            # Only materialize the text when the repair strategies need it,
+            # with the universal newline translation text mode would apply
+            try:
+                f.seek(0)
+                content = f.read().decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+            except Exception as e:
+                return None, f"Failed to read file: {str(e)}"
         
-        # Strategy 2: Apply repairs and try again
-        try:
-            repaired_content = YAMLRepairer.repair_yaml_content(content)
-            data = yaml.safe_load(repaired_content)
-            if data:
-                logger.info(f"Successfully repaired YAML for {file_path}")
-                return data, None
-        except yaml.YAMLError as e:
-            pass
+        # Strategy 2: Apply repairs and try again, unless they would be a
+        # no-op and re-parsing would just repeat the Strategy 1 failure
+        if YAMLRepairer.is_repairable(content):
+            try:
+                repaired_content = YAMLRepairer.repair_yaml_content(content)
+                data = yaml.load(repaired_content, Loader=_Loader)
+                if data:
+                    logger.info(f"Successfully repaired YAML for {file_path}")
+                    return data, None
+            except yaml.YAMLError as e:
+                pass
         
-        # Strategy 3: Try line-by-line recovery
+        # Strategy 3: Recover flat key/value pairs with compiled scans
         try:
             data = {}
-            current_key = None
-            current_value = []
+            key_lines = list(_KV_LINE_RE.finditer(content))
             
-            for line in content.split('\n'):
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
+            for i, match in enumerate(key_lines):
+                key = match.group(1).rstrip()
+                first = match.group(2).strip()
+                current_value = [first] if first else []
                 
-                if ':' in line and not line.startswith('-'):
-                    if current_key and current_value:
-                        data[current_key] = '\n'.join(current_value).strip()
-                    
-                    parts = line.split(':', 1)
-                    current_key = parts[0].strip()
-                    current_value = [parts[1].strip()] if len(parts) > 1 and parts[1].strip() else []
-                elif current_key:
-                    current_value.append(line)
-            
-            if current_key and current_value:
-                data[current_key] = '\n'.join(current_value).strip()
+                # Continuation lines run up to the next key line
+                end = key_lines[i + 1].start() if i + 1 < len(key_lines) else len(content)
+                current_value.extend(
+                    line.strip() for line in _CONTINUATION_RE.findall(content[match.end():end])
+                )
+                
+                if key and current_value:
+                    data[key] = '\n'.join(current_value).strip()
             
             if data:
                 logger.warning(f"Used fallback parsing for {file_path}")
@@ -134,104 +203,95 @@ class YAMLRepairer:
 class MarkerNormalizer:
     """Normalizes markers to Lean Deep 3.11 compliance"""
     
-    def __init__(self):
-        self.frame_templates = {
-            'ENTITY': {
-                'signal': 'Named entity detection patterns',
+    def __init__(self) -> None:
+        # Shared, immutable default tags; only copied into each marker's list
+        self._default_tags: Tuple[str, ...] = ('normalized', 'ld3.11')
+        # Each template is (signal, remaining frame fields); only the signal is
+        # ever customized per marker
+        self.frame_templates: Dict[str, Tuple[str, Dict[str, str]]] = {
+            'ENTITY': ('Named entity detection patterns', {
                 'concept': 'Recognition of persons, organizations, locations',
                 'pragmatics': 'Entity extraction and classification',
                 'narrative': 'Identifying key actors and references in discourse'
-            },
-            'ATTACHMENT': {
-                'signal': 'Attachment style linguistic patterns',
+            }),
+            'ATTACHMENT': ('Attachment style linguistic patterns', {
                 'concept': 'Psychological attachment theory markers',
                 'pragmatics': 'Relationship pattern identification',
                 'narrative': 'Understanding interpersonal dynamics through language'
-            },
-            'EMOTION': {
-                'signal': 'Emotional expression patterns',
+            }),
+            'EMOTION': ('Emotional expression patterns', {
                 'concept': 'Affective state indicators',
                 'pragmatics': 'Emotion recognition and tracking',
                 'narrative': 'Monitoring emotional trajectories in conversation'
-            },
-            'CONVERSATION': {
-                'signal': 'Conversational dynamics patterns',
+            }),
+            'CONVERSATION': ('Conversational dynamics patterns', {
                 'concept': 'Interaction and dialogue structures',
                 'pragmatics': 'Conversation flow analysis',
                 'narrative': 'Understanding communication patterns and strategies'
-            },
-            'META': {
-                'signal': 'Meta-level communication patterns',
+            }),
+            'META': ('Meta-level communication patterns', {
                 'concept': 'Higher-order linguistic structures',
                 'pragmatics': 'Meta-communication analysis',
                 'narrative': 'Detecting abstract patterns across multiple markers'
-            }
+            })
         }
     
-    def detect_category(self, marker_data: Dict) -> str:
+    def detect_category(self, marker_data: Dict[str, Any]) -> str:
         """Detect marker category based on name and content"""
         marker_name = marker_data.get('marker_name', '')
-        description = str(marker_data.get('beschreibung', ''))
         
-        # Check marker name prefixes
-        if marker_name.startswith('A_LOC') or marker_name.startswith('A_PER') or marker_name.startswith('A_ORG'):
+        # Check marker name prefixes first; the description is only
+        # stringified and lowercased once, when the name alone is not enough
+        if marker_name.startswith(_ENTITY_PREFIXES):
             return 'ENTITY'
-        elif 'ATTACHMENT' in marker_name or 'attachment' in description.lower():
+        elif 'ATTACHMENT' in marker_name:
+            return 'ATTACHMENT'
+        
+        description = str(marker_data.get('beschreibung', '')).lower()
+        
+        if 'attachment' in description:
             return 'ATTACHMENT'
-        elif 'EMO_' in marker_name or 'emotion' in description.lower():
+        elif 'EMO_' in marker_name or 'emotion' in description:
             return 'EMOTION'
         elif marker_name.startswith('MM_'):
             return 'META'
-        elif marker_name.startswith('C_') or marker_name.startswith('S_'):
-            return 'CONVERSATION'
         else:
-            return 'CONVERSATION'  # Default category
+            return 'CONVERSATION'  # C_, S_ and default category
     
-    def generate_frame(self, marker_data: Dict) -> Dict[str, str]:
+    def generate_frame(self, marker_data: Dict[str, Any]) -> Dict[str, str]:
         """Generate frame structure based on marker category"""
         category = self.detect_category(marker_data)
-        template = self.frame_templates.get(category, self.frame_templates['CONVERSATION'])
-        
-        # Customize based on specific marker content
-        marker_name = marker_data.get('marker_name', '')
-        description = str(marker_data.get('beschreibung', ''))
-        
-        frame = template.copy()
+        signal, fields = self.frame_templates.get(category, self.frame_templates['CONVERSATION'])
         
         # Add marker-specific details
-        if marker_name:
-            frame['signal'] = f"{template['signal']} for {marker_name}"
-        
-        return frame
+        marker_name = marker_data.get('marker_name', '')
+        return {'signal': f"{signal} for {marker_name}" if marker_name else signal, **fields}
     
-    def ensure_minimum_examples(self, examples: List) -> List[str]:
+    def ensure_minimum_examples(self, examples: Any) -> List[str]:
         """Ensure at least MIN_EXAMPLES examples exist"""
-        # Clean and normalize existing examples
-        clean_examples = []
-        
-        if isinstance(examples, list):
-            for ex in examples:
-                if isinstance(ex, str):
-                    # Remove leading dash and quotes
-                    ex = ex.strip()
-                    if ex.startswith('- '):
-                        ex = ex[2:]
-                    ex = ex.strip('"')
-                    if ex and ex != 'examples:' and ex != '-':
-                        clean_examples.append(ex)
+        # Clean and normalize existing examples: strip, drop a leading list
+        # dash and surrounding quotes, then discard leftover YAML syntax
+        stripped = (ex.strip() for ex in examples if isinstance(ex, str)) if isinstance(examples, list) else ()
+        clean_examples = [
+            ex for ex in ((ex[2:] if ex.startswith('- ') else ex).strip('"') for ex in stripped)
+            if ex and ex not in ('examples:', '-')
+        ]
         
         # Generate additional examples if needed
-        while len(clean_examples) < CONFIG['MIN_EXAMPLES']:
-            template_idx = len(clean_examples) + 1
-            clean_examples.append(f"Example usage pattern {template_idx} for this marker")
+        clean_examples.extend(
+            f"Example usage pattern {template_idx} for this marker"
+            for template_idx in range(len(clean_examples) + 1, CONFIG['MIN_EXAMPLES'] + 1)
+        )
         
         return clean_examples
     
-    def normalize_marker(self, marker_data: Dict, file_name: str) -> Dict:
+    def normalize_marker(self, marker_data: Dict[str, Any], file_name: str) -> Dict[str, Any]:
         """Normalize a single marker to LD3.11 compliance"""
         # Extract marker ID from filename or marker_name
         marker_id = marker_data.get('marker_name', file_name.replace('.yaml', ''))
         
+        metadata = marker_data.get('metadata', {})
+        
         # Create normalized structure
         normalized = {
             '_id': marker_id,
@@ -239,10 +299,11 @@ class MarkerNormalizer:
             'examples': self.ensure_minimum_examples(marker_data.get('beispiele', [])),
             'pattern': f"Pattern for {marker_id}",  # Default pattern
             'metadata': {
-                'created': marker_data.get('metadata', {}).get('created_at', datetime.now().isoformat()),
-                'author': marker_data.get('metadata', {}).get('created_by', 'complete_markers.py'),
-                'version': marker_data.get('metadata', {}).get('version', '1.0'),
-                'tags': list(set(marker_data.get('metadata', {}).get('tags', ['normalized', 'ld3.11'])))
+                'created': metadata.get('created_at', datetime.now().isoformat()),
+                'author': metadata.get('created_by', 'complete_markers.py'),
+                'version': metadata.get('version', '1.0'),
+                # Deduplicated in a stable order; key=str tolerates mixed tag types
+                'tags': sorted(set(metadata.get('tags', self._default_tags)), key=str)
             }
         }
         
@@ -260,112 +321,191 @@ class MarkerNormalizer:
         return normalized
 
 
-def process_markers():
+def _dump_json(obj: Any) -> bytes:
+    """Serialize an error report as indented UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _quote(value: str) -> str:
+    """Render a double-quoted YAML scalar (JSON string escapes are valid YAML)"""
+    return json.dumps(value, ensure_ascii=False).translate(_YAML_ESCAPES)
+
+
+def _emit_field(key: str, value: Any, indent: str) -> Optional[str]:
+    """Render a string or list-of-strings field, or None for anything else"""
+    if isinstance(value, str):
+        return f"{indent}{key}: {_quote(value)}\n"
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        if not value:
+            return f"{indent}{key}: []\n"
+        return f"{indent}{key}:\n" + ''.join(f"{indent}- {_quote(item)}\n" for item in value)
+    return None
+
+
+def _emit_normalized(normalized: Dict[str, Any]) -> Optional[bytes]:
+    """Emit a normalized marker as UTF-8 YAML without the generic dump machinery.
+    
+    Returns None when a field falls outside the fixed schema of strings,
+    string lists and the frame/metadata mappings (or cannot be encoded),
+    so the caller can fall back to yaml.dump.
+    """
+    parts: List[str] = []
+    for key, value in normalized.items():
+        items: Iterable[Tuple[str, Any]]
+        if key in ('frame', 'metadata'):
+            parts.append(f"{key}:\n")
+            items, indent = value.items(), '  '
+        else:
+            items, indent = ((key, value),), ''
+        
+        for field_key, field_value in items:
+            field = _emit_field(field_key, field_value, indent)
+            if field is None:
+                return None
+            parts.append(field)
+    try:
+        return ''.join(parts).encode('utf-8')
+    except UnicodeEncodeError:
+        return None
+
+
+# Per-process normalizer, created lazily inside each worker
+_normalizer: Optional[MarkerNormalizer] = None
+
+
+def _process_one(path_str: str) -> Dict[str, str]:
+    """Parse, normalize and write (or quarantine) one marker file.
+    
+    Runs inside a worker process and returns the file's report row.
+    """
+    global _normalizer
+    if _normalizer is None:
+        _normalizer = MarkerNormalizer()
+    
+    file_name = os.path.basename(path_str)
+    stem = os.path.splitext(file_name)[0]
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Processing {file_name}")
+    
+    # Try to parse and repair YAML
+    marker_data, error = YAMLRepairer.parse_with_recovery(path_str)
+    
+    if error:
+        # Quarantine file
+        quarantine_path = os.path.join(CONFIG['QUARANTINE'], file_name)
+        error_path = os.path.join(CONFIG['QUARANTINE'], f"{stem}.errors.json")
+        
+        # Copy original file to quarantine
+        shutil.copyfile(path_str, quarantine_path)
+        
+        # Write error details
+        error_data = {
+            'file': file_name,
+            'error': error,
+            'timestamp': datetime.now().isoformat(),
+            'recovery_attempted': True
+        }
+        with open(error_path, 'wb') as f:
+            f.write(_dump_json(error_data))
+        
+        logger.error(f"Quarantined {file_name}: {error}")
+        return {
+            'file': file_name,
+            'status': 'QUARANTINED',
+            'error': 'YAML_ERROR',
+            'details': error
+        }
+    
+    try:
+        # Normalize marker
+        normalized = _normalizer.normalize_marker(marker_data, file_name)
+        
+        # Write normalized marker
+        output_path = os.path.join(CONFIG['OUTPUT_DIR'], file_name)
+        data = _emit_normalized(normalized)
+        if data is not None:
+            with open(output_path, 'wb') as f:
+                f.write(data)
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                yaml.dump(normalized, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Successfully normalized {file_name}")
+        return {
+            'file': file_name,
+            'status': 'SUCCESS',
+            'error': '',
+            'details': f"Normalized with {len(normalized['examples'])} examples"
+        }
+        
+    except Exception as e:
+        # Quarantine file with processing error
+        quarantine_path = os.path.join(CONFIG['QUARANTINE'], file_name)
+        error_path = os.path.join(CONFIG['QUARANTINE'], f"{stem}.errors.json")
+        
+        shutil.copyfile(path_str, quarantine_path)
+        
+        error_data = {
+            'file': file_name,
+            'error': str(e),
+            'error_type': type(e).__name__,
+            'timestamp': datetime.now().isoformat(),
+            'stage': 'normalization'
+        }
+        with open(error_path, 'wb') as f:
+            f.write(_dump_json(error_data))
+        
+        logger.error(f"Failed to normalize {file_name}: {e}")
+        return {
+            'file': file_name,
+            'status': 'QUARANTINED',
+            'error': 'NORMALIZATION_ERROR',
+            'details': str(e)
+        }
+
+
+def process_markers() -> None:
     """Main processing function"""
     # Create output directories
     os.makedirs(CONFIG['OUTPUT_DIR'], exist_ok=True)
     os.makedirs(CONFIG['QUARANTINE'], exist_ok=True)
     os.makedirs(os.path.dirname(CONFIG['SUMMARY_LOG']), exist_ok=True)
     
-    # Initialize counters and report data
-    total_files = 0
-    successful = 0
-    quarantined = 0
-    report_data = []
-    
-    repairer = YAMLRepairer()
-    normalizer = MarkerNormalizer()
-    
     # Process all YAML files in marker directory
-    marker_path = Path(CONFIG['MARKER_DIR'])
-    
-    if not marker_path.exists():
+    if not os.path.exists(CONFIG['MARKER_DIR']):
         logger.error(f"Marker directory '{CONFIG['MARKER_DIR']}' does not exist")
         return
     
-    for yaml_file in marker_path.glob('*.yaml'):
-        total_files += 1
-        file_name = yaml_file.name
-        logger.info(f"Processing {file_name}")
-        
-        # Try to parse and repair YAML
-        marker_data, error = repairer.parse_with_recovery(str(yaml_file))
-        
-        if error:
-            # Quarantine file
-            quarantine_path = Path(CONFIG['QUARANTINE']) / file_name
-            error_path = Path(CONFIG['QUARANTINE']) / f"{yaml_file.stem}.errors.json"
-            
-            # Copy original file to quarantine
-            quarantine_path.write_text(yaml_file.read_text())
-            
-            # Write error details
-            error_data = {
-                'file': file_name,
-                'error': error,
-                'timestamp': datetime.now().isoformat(),
-                'recovery_attempted': True
-            }
-            error_path.write_text(json.dumps(error_data, indent=2))
-            
-            quarantined += 1
-            report_data.append({
-                'file': file_name,
-                'status': 'QUARANTINED',
-                'error': 'YAML_ERROR',
-                'details': error
-            })
-            logger.error(f"Quarantined {file_name}: {error}")
-            continue
-        
-        try:
-            # Normalize marker
-            normalized = normalizer.normalize_marker(marker_data, file_name)
-            
-            # Write normalized marker
-            output_path = Path(CONFIG['OUTPUT_DIR']) / file_name
-            with open(output_path, 'w', encoding='utf-8') as f:
-                yaml.dump(normalized, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
-            
-            successful += 1
-            report_data.append({
-                'file': file_name,
-                'status': 'SUCCESS',
-                'error': '',
-                'details': f"Normalized with {len(normalized['examples'])} examples"
-            })
-            logger.info(f"Successfully normalized {file_name}")
-            
-        except Exception as e:
-            # Quarantine file with processing error
-            quarantine_path = Path(CONFIG['QUARANTINE']) / file_name
-            error_path = Path(CONFIG['QUARANTINE']) / f"{yaml_file.stem}.errors.json"
-            
-            quarantine_path.write_text(yaml_file.read_text())
-            
-            error_data = {
-                'file': file_name,
-                'error': str(e),
-                'error_type': type(e).__name__,
-                'timestamp': datetime.now().isoformat(),
-                'stage': 'normalization'
-            }
-            error_path.write_text(json.dumps(error_data, indent=2))
-            
-            quarantined += 1
-            report_data.append({
-                'file': file_name,
-                'status': 'QUARANTINED',
-                'error': 'NORMALIZATION_ERROR',
-                'details': str(e)
-            })
-            logger.error(f"Failed to normalize {file_name}: {e}")
+    # scandir entries carry the name and file type from the directory listing,
+    # so no Path objects or extra stat calls are needed to filter them
+    with os.scandir(CONFIG['MARKER_DIR']) as it:
+        entries = [e for e in it if e.is_file() and e.name.endswith('.yaml')]
     
-    # Write TSV report
-    with open(CONFIG['SUMMARY_LOG'], 'w', encoding='utf-8') as f:
-        f.write("File\tStatus\tError\tDetails\n")
-        for entry in report_data:
-            f.write(f"{entry['file']}\t{entry['status']}\t{entry['error']}\t{entry['details']}\n")
+    # Largest files first, one per task, so a long-running file starts early
+    # instead of being queued behind a chunk of others
+    entries.sort(key=lambda e: e.stat().st_size, reverse=True)
+    yaml_files = [e.path for e in entries]
+    
+    total_files = 0
+    successful = 0
+    quarantined = 0
+    
+    # Files are independent and parsing is CPU-bound, so fan out across
+    # processes; report rows are written to the TSV as they come back
+    with open(CONFIG['SUMMARY_LOG'], 'wb', buffering=1 << 20) as report_f:
+        report_f.write(b"File\tStatus\tError\tDetails\n")
+        
+        with ProcessPoolExecutor() as executor:
+            for row in executor.map(_process_one, yaml_files, chunksize=1):
+                total_files += 1
+                if row['status'] == 'SUCCESS':
+                    successful += 1
+                else:
+                    quarantined += 1
+                report_f.write(f"{row['file']}\t{row['status']}\t{row['error']}\t{row['details']}\n".encode('utf-8'))
     
     # Print summary
     print(f"\nProcessing Complete:")
@@ -8,13 +8,19 @@ error reporting.
 """
 
 import yaml
+import io
 import os
 import sys
 import json
+import hashlib
 import logging
+import logging.handlers
+import mmap
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, Iterable, Sequence
 
 # Configuration Section
 CONFIG = {
@@ -25,32 +31,81 @@ CONFIG = {
     'MIN_EXAMPLES': 5,
     'LOG_LEVEL': 'INFO',
     'LOG_FILE': 'tools/qualify_marker_set.log',
+    'CACHE_FILE': 'tools/.qualify_cache.json',  # Results keyed by file content hash
     'APPEND_TO_REPORT': True  # Append to existing report
 }
 
-# Set up logging
+# Set up logging; file records are buffered and written in batches, with
+# errors flushing the buffer straight away
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+_file_handler = logging.FileHandler(CONFIG['LOG_FILE'], delay=True)
+_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+_log_buffer = logging.handlers.MemoryHandler(capacity=1000, flushLevel=logging.ERROR, target=_file_handler)
 logging.basicConfig(
     level=getattr(logging, CONFIG['LOG_LEVEL']),
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler(CONFIG['LOG_FILE']),
+        _log_buffer,
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader; the pure-Python one is several times slower
+try:
+    from yaml import CSafeLoader as _Loader
+    _LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader as _Loader
+    _LIBYAML = False
+    logger.warning("PyYAML was built without libyaml; falling back to the pure-Python SafeLoader")
+
+# Files above this size are memory-mapped for libyaml instead of read into a
+# bytes object; for smaller ones setting up the mapping costs more than it saves
+_MMAP_MIN_SIZE = 16384
+
+# Prefer orjson for the quarantine error reports when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Distinguishes an absent key from one explicitly set to null
+_MISSING = object()
+
+# Qualification statuses
+_ST_QUALIFIED = 'QUALIFIED'
+_ST_FAILED = 'FAILED'
+_ST_ERROR = 'ERROR'
+
 
 class LeanDeep31Validator:
     """Validates markers against Lean Deep 3.11 specification"""
     
+    # Bump whenever the validation rules change so cached results are discarded
+    VALIDATOR_VERSION = 1
+    
+    # Keys every composed_of component must have
+    _COMPOSED_REQUIRED = frozenset({'type', 'marker_ids'})
+    
     def __init__(self):
-        self.required_fields = {'_id', 'frame', 'examples'}
-        self.frame_fields = {'signal', 'concept', 'pragmatics', 'narrative'}
-        self.optional_fields = {'metadata', 'category', 'semantic_id', 'original_description',
-                               'pattern', 'composed_of', 'detect_class'}
+        self.required_fields = frozenset({'_id', 'frame', 'examples'})
+        self.frame_fields = frozenset({'signal', 'concept', 'pragmatics', 'narrative'})
+        self.optional_fields = frozenset({'metadata', 'category', 'semantic_id', 'original_description',
+                                          'pattern', 'composed_of', 'detect_class'})
+        self.recommended_metadata = ('created', 'author', 'version', 'tags')
+        # optional_fields already covers pattern, composed_of and detect_class
+        self._all_allowed = self.required_fields | self.optional_fields
         self.errors = []
         self.warnings = []
     
+    def validate_id(self, marker_id: Any) -> bool:
+        """Validate _id is a non-empty string"""
+        if not isinstance(marker_id, str) or not marker_id.strip():
+            self.errors.append("_id must be a non-empty string")
+            return False
+        return True
+    
     def validate_xor_constraint(self, marker: Dict) -> bool:
         """Validate XOR constraint: exactly one of pattern, composed_of, or detect_class"""
         xor_fields = ['pattern', 'composed_of', 'detect_class']
@@ -67,7 +122,7 @@ class LeanDeep31Validator:
             self.errors.append(f"Frame must be a dictionary, got {type(frame).__name__}")
             return False
         
-        missing_fields = self.frame_fields - set(frame.keys())
+        missing_fields = {f for f in self.frame_fields if f not in frame}
         if missing_fields:
             self.errors.append(f"Frame missing required fields: {missing_fields}")
             return False
@@ -92,16 +147,19 @@ class LeanDeep31Validator:
             self.errors.append(f"Insufficient examples: found {len(examples)}, minimum {CONFIG['MIN_EXAMPLES']} required")
             return False
         
-        # Check for duplicates
-        unique_examples = set()
-        for i, example in enumerate(examples):
-            if not isinstance(example, str):
-                self.errors.append(f"Example {i} must be a string, got {type(example).__name__}")
-                return False
-            
-            if example in unique_examples:
-                self.warnings.append(f"Duplicate example found: '{example[:50]}...'")
-            unique_examples.add(example)
+        # Check types in one pass; the offending index is only looked up on failure
+        if not all(type(example) is str for example in examples):
+            i, example = next((i, e) for i, e in enumerate(examples) if type(e) is not str)
+            self.errors.append(f"Example {i} must be a string, got {type(example).__name__}")
+            return False
+        
+        # Check for duplicates, reporting each one only if there are any
+        if len(set(examples)) != len(examples):
+            unique_examples = set()
+            for example in examples:
+                if example in unique_examples:
+                    self.warnings.append(f"Duplicate example found: '{example[:50]}...'")
+                unique_examples.add(example)
         
         return True
     
@@ -115,9 +173,7 @@ class LeanDeep31Validator:
             return False
         
         # Check recommended metadata fields
-        recommended = {'created', 'author', 'version', 'tags'}
-        present = set(metadata.keys())
-        missing = recommended - present
+        missing = {f for f in self.recommended_metadata if f not in metadata}
         
         if missing:
             self.warnings.append(f"Metadata missing recommended fields: {missing}")
@@ -128,10 +184,13 @@ class LeanDeep31Validator:
                 self.errors.append("Metadata 'tags' must be a list")
                 return False
             
-            # Check for duplicate tags
-            tags = metadata['tags']
-            if len(tags) != len(set(tags)):
-                self.warnings.append("Duplicate tags found in metadata")
+            # Check for duplicate tags, stopping at the first one
+            seen_tags = set()
+            for tag in metadata['tags']:
+                if tag in seen_tags:
+                    self.warnings.append("Duplicate tags found in metadata")
+                    break
+                seen_tags.add(tag)
         
         return True
     
@@ -157,64 +216,117 @@ class LeanDeep31Validator:
                 self.errors.append(f"composed_of[{i}] must be a dictionary")
                 return False
             
-            if 'type' not in component or 'marker_ids' not in component:
+            if not component.keys() >= self._COMPOSED_REQUIRED:
                 self.errors.append(f"composed_of[{i}] must have 'type' and 'marker_ids' fields")
                 return False
         
         return True
     
-    def validate_marker(self, marker: Dict) -> Tuple[bool, List[str], List[str]]:
-        """Validate a complete marker. Returns (is_valid, errors, warnings)"""
-        self.errors = []
-        self.warnings = []
-        
-        # Check required fields
-        missing_required = self.required_fields - set(marker.keys())
+    # (field, validator, blocking) in check order. Fields that are absent are
+    # skipped, a None key hands the whole marker to its validator, and a
+    # failed blocking check ends validation before the later checks run.
+    _FIELD_HANDLERS = (
+        ('_id', validate_id, False),
+        ('frame', validate_frame_structure, True),
+        ('examples', validate_examples, True),
+        (None, validate_xor_constraint, True),
+        ('pattern', validate_pattern, False),
+        ('composed_of', validate_composed_of, False),
+        ('metadata', validate_metadata, False),
+    )
+    
+    def validate_required_fields(self, keys: Iterable) -> bool:
+        """Validate that all required fields are among the marker's keys"""
+        missing_required = {f for f in self.required_fields if f not in keys}
         if missing_required:
             self.errors.append(f"Missing required fields: {missing_required}")
-            return False, self.errors, self.warnings
-        
-        # Validate _id
-        if not isinstance(marker['_id'], str) or not marker['_id'].strip():
-            self.errors.append("_id must be a non-empty string")
-        
-        # Validate frame
-        if not self.validate_frame_structure(marker.get('frame')):
-            return False, self.errors, self.warnings
-        
-        # Validate examples
-        if not self.validate_examples(marker.get('examples')):
-            return False, self.errors, self.warnings
-        
-        # Validate XOR constraint
-        if not self.validate_xor_constraint(marker):
-            return False, self.errors, self.warnings
-        
-        # Validate optional fields if present
-        if 'pattern' in marker:
-            self.validate_pattern(marker['pattern'])
+            return False
+        return True
+    
+    def validate_keys(self, keys: Iterable) -> Tuple[bool, List[str], List[str]]:
+        """Start validating a marker from its top-level keys alone.
+        Returns (has_required_fields, errors, warnings)"""
+        self.errors.clear()
+        self.warnings.clear()
+        
+        has_required = self.validate_required_fields(keys)
+        return has_required, self.errors.copy(), self.warnings.copy()
+    
+    def validate_marker(self, marker: Dict) -> Tuple[bool, List[str], List[str]]:
+        """Validate a complete marker. Returns (is_valid, errors, warnings)
         
-        if 'composed_of' in marker:
-            self.validate_composed_of(marker['composed_of'])
+        The error and warning lists are reused between calls, so copies are
+        returned.
+        """
+        self.errors.clear()
+        self.warnings.clear()
         
-        if 'metadata' in marker:
-            self.validate_metadata(marker['metadata'])
+        # Check required fields
+        marker_keys = marker.keys()
+        if not self.validate_required_fields(marker_keys):
+            return False, self.errors.copy(), self.warnings.copy()
+        
+        # Validate fields in one pass over the handler table (an explicit null
+        # is still validated)
+        for key, validator, blocking in self._FIELD_HANDLERS:
+            if key is None:
+                ok = validator(self, marker)
+            else:
+                value = marker.get(key, _MISSING)
+                if value is _MISSING:
+                    continue
+                ok = validator(self, value)
+            if blocking and not ok:
+                return False, self.errors.copy(), self.warnings.copy()
         
         # Check for unknown fields
-        all_allowed_fields = self.required_fields | self.optional_fields | {'pattern', 'composed_of', 'detect_class'}
-        unknown_fields = set(marker.keys()) - all_allowed_fields
+        unknown_fields = marker_keys - self._all_allowed
         if unknown_fields:
             self.warnings.append(f"Unknown fields will be preserved: {unknown_fields}")
         
         is_valid = len(self.errors) == 0
-        return is_valid, self.errors, self.warnings
+        return is_valid, self.errors.copy(), self.warnings.copy()
+
+
+class _MarkerMap(mmap.mmap):
+    """Read-only file mapping; the name keeps the file path in YAML errors"""
+    name = '<file>'
+
+
+def _root_mapping_keys(node: Optional[yaml.Node]) -> Optional[Set[str]]:
+    """String keys of a composed root mapping.
+    
+    Returns None when the keys cannot be known without constructing the
+    document: the root is not a mapping, is empty, or uses merge keys.
+    """
+    if not isinstance(node, yaml.MappingNode) or not node.value:
+        return None
+    
+    keys = set()
+    for key_node, _ in node.value:
+        if key_node.tag == 'tag:yaml.org,2002:merge':
+            return None
+        if key_node.tag == 'tag:yaml.org,2002:str':
+            keys.add(key_node.value)
+    return keys
+
+
+def _dump_json(obj: Any) -> bytes:
+    """Serialize an error report as indented UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
 
 
 class MarkerQualifier:
     """Qualifies markers based on validation results"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[Dict[str, Dict[str, Any]]] = None, run_ts: Optional[str] = None):
         self.validator = LeanDeep31Validator()
+        self.cache = cache if cache is not None else {}
+        self._quar_dir = Path(CONFIG['QUARANTINE'])
+        # Error reports are stamped with the start of the run, not per file
+        self._run_ts = run_ts if run_ts is not None else datetime.now().isoformat()
     
     def calculate_quality_score(self, marker: Dict, warnings: List[str]) -> Tuple[float, str]:
         """Calculate quality score and rating"""
@@ -233,12 +345,12 @@ class MarkerQualifier:
         if len(marker.get('examples', [])) > CONFIG['MIN_EXAMPLES']:
             score += 5
         
-        # Bonus for detailed frame descriptions
-        if 'frame' in marker:
-            frame = marker['frame']
-            avg_length = sum(len(frame.get(f, '')) for f in frame) / 4
-            if avg_length > 50:
-                score += 5
+        # Bonus for detailed frame descriptions (valid markers always have a
+        # frame; every field counts towards the total, spread over the four
+        # required ones)
+        avg_length = sum(map(len, marker['frame'].values())) / 4
+        if avg_length > 50:
+            score += 5
         
         # Determine rating
         if score >= 90:
@@ -254,73 +366,172 @@ class MarkerQualifier:
         
         return max(0, min(100, score)), rating
     
-    def qualify_marker(self, marker_path: Path) -> Dict[str, Any]:
-        """Qualify a single marker file"""
-        result = {
-            'file': marker_path.name,
-            'status': 'UNKNOWN',
-            'errors': [],
-            'warnings': [],
+    @staticmethod
+    def _failure_result(file_name: str, status: str, errors: Sequence[str], warnings: Sequence[str] = (),
+                        content_hash: Optional[str] = None) -> Dict[str, Any]:
+        """Result for a marker that did not qualify"""
+        return {
+            'file': file_name,
+            'status': status,
+            'errors': errors,
+            'warnings': warnings,
             'quality_score': 0,
-            'quality_rating': 'N/A'
+            'quality_rating': 'N/A',
+            'content_hash': content_hash
         }
-        
+    
+    def qualify_marker(self, marker_path: str) -> Tuple[Dict[str, Any], Optional[List[str]]]:
+        """Qualify a single marker file.
+        
+        Returns (result, quarantine_errors). quarantine_errors is None when the
+        file stays where it is; otherwise the caller moves it to quarantine.
+        """
+        file_name = os.path.basename(marker_path)
+        data = None
         try:
-            # Load marker
-            with open(marker_path, 'r', encoding='utf-8') as f:
-                marker = yaml.safe_load(f)
+            with open(marker_path, 'rb') as f:
+                if _LIBYAML and os.fstat(f.fileno()).st_size > _MMAP_MIN_SIZE:
+                    data = _MarkerMap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    data.name = marker_path
+                else:
+                    data = f.read()
+            
+            # Unchanged files reuse the result of an earlier run
+            content_hash = hashlib.sha256(data).hexdigest()
+            cached = self.cache.get(content_hash)
+            if cached is not None:
+                errors = list(cached['errors'])
+                return {
+                    'file': file_name,
+                    'status': cached['status'],
+                    'errors': errors,
+                    'warnings': list(cached['warnings']),
+                    'quality_score': cached['quality_score'],
+                    'quality_rating': cached['quality_rating'],
+                    'content_hash': content_hash
+                }, (errors if cached['quarantine'] else None)
+            
+            # Load marker; libyaml decodes the raw bytes itself, and the stream
+            # name keeps the file path in parse error messages
+            if isinstance(data, bytes):
+                stream = io.BytesIO(data)
+                stream.name = marker_path
+            else:
+                stream = data
+            loader = _Loader(stream)
+            try:
+                # Compose the node tree first, so a root mapping that is
+                # missing required fields is rejected before its Python
+                # objects are constructed
+                root = loader.get_single_node()
+                root_keys = _root_mapping_keys(root)
+                if root_keys is not None:
+                    has_required, errors, warnings = self.validator.validate_keys(root_keys)
+                    if not has_required:
+                        return self._failure_result(file_name, _ST_FAILED, errors, warnings, content_hash), errors
+                marker = loader.construct_document(root) if root is not None else None
+            finally:
+                loader.dispose()
             
             if not marker:
-                result['status'] = 'FAILED'
-                result['errors'] = ['Empty or invalid YAML file']
-                return result
+                return self._failure_result(file_name, _ST_FAILED, ['Empty or invalid YAML file'], (), content_hash), None
             
             # Validate marker
             is_valid, errors, warnings = self.validator.validate_marker(marker)
-            result['errors'] = errors
-            result['warnings'] = warnings
             
             if is_valid:
                 # Calculate quality score
                 score, rating = self.calculate_quality_score(marker, warnings)
-                result['quality_score'] = score
-                result['quality_rating'] = rating
-                result['status'] = 'QUALIFIED'
                 
                 # Marker stays in final_marker_set/
-                logger.info(f"Qualified {marker_path.name} - Score: {score:.1f} ({rating})")
-            else:
-                result['status'] = 'FAILED'
-                # Move to quarantine
-                self._quarantine_marker(marker_path, errors)
-                logger.error(f"Failed qualification for {marker_path.name}: {errors[0]}")
+                return {
+                    'file': file_name,
+                    'status': _ST_QUALIFIED,
+                    'errors': (),
+                    'warnings': warnings,
+                    'quality_score': score,
+                    'quality_rating': rating,
+                    'content_hash': content_hash
+                }, None
+            
+            # Move to quarantine
+            return self._failure_result(file_name, _ST_FAILED, errors, warnings, content_hash), errors
             
         except Exception as e:
-            result['status'] = 'ERROR'
-            result['errors'] = [f"Processing error: {str(e)}"]
-            self._quarantine_marker(marker_path, [str(e)])
-            logger.error(f"Error processing {marker_path.name}: {e}")
+            return self._failure_result(file_name, _ST_ERROR, [f"Processing error: {str(e)}"]), [str(e)]
         
-        return result
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
     
     def _quarantine_marker(self, marker_path: Path, errors: List[str]):
         """Move failed marker to quarantine with error report"""
-        quarantine_path = Path(CONFIG['QUARANTINE']) / marker_path.name
-        error_path = Path(CONFIG['QUARANTINE']) / f"{marker_path.stem}.errors.json"
+        quarantine_path = self._quar_dir / marker_path.name
+        error_path = self._quar_dir / f"{marker_path.stem}.errors.json"
         
-        # Move file to quarantine
-        if marker_path.exists():
-            quarantine_path.write_text(marker_path.read_text())
-            marker_path.unlink()  # Remove from final_marker_set
+        # Move file to quarantine (removing it from final_marker_set); a
+        # rename where possible, a copy and delete across filesystems
+        try:
+            os.replace(marker_path, quarantine_path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            shutil.move(str(marker_path), str(quarantine_path))
         
         # Write error report
         error_data = {
             'file': marker_path.name,
             'validation_errors': errors,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._run_ts,
             'stage': 'qualification'
         }
-        error_path.write_text(json.dumps(error_data, indent=2))
+        error_path.write_bytes(_dump_json(error_data))
+
+
+def _cache_signature() -> List[Any]:
+    """Settings a cached result depends on besides the file content"""
+    return [LeanDeep31Validator.VALIDATOR_VERSION, CONFIG['MIN_EXAMPLES']]
+
+
+def _load_cache() -> Dict[str, Dict[str, Any]]:
+    """Load cached results, discarding them if the rules have changed since"""
+    try:
+        with open(CONFIG['CACHE_FILE'], 'rb') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if not isinstance(cache, dict) or cache.get('signature') != _cache_signature():
+        return {}
+    entries = cache.get('entries')
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_cache(entries: Dict[str, Dict[str, Any]]):
+    """Atomically replace the cache file with the given entries"""
+    tmp_path = f"{CONFIG['CACHE_FILE']}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'signature': _cache_signature(), 'entries': entries}, f)
+    os.replace(tmp_path, CONFIG['CACHE_FILE'])
+
+
+# Per-process qualifier, set up by _init_qualifier in each worker
+_qualifier: Optional[MarkerQualifier] = None
+
+
+def _init_qualifier(cache: Dict[str, Dict[str, Any]]):
+    """Worker initializer: create the qualifier with the loaded cache"""
+    global _qualifier
+    _qualifier = MarkerQualifier(cache)
+
+
+def _qualify_one(path_str: str) -> Tuple[Dict[str, Any], Optional[List[str]]]:
+    """Qualify one marker file inside a worker process.
+    
+    Only reads the file; quarantining and logging are left to the parent so
+    that filesystem changes happen serially.
+    """
+    return _qualifier.qualify_marker(path_str)
 
 
 def qualify_marker_set():
@@ -333,20 +544,21 @@ def qualify_marker_set():
     total_files = 0
     qualified = 0
     failed = 0
-    report_data = []
     
-    qualifier = MarkerQualifier()
+    run_ts = datetime.now().isoformat()
+    qualifier = MarkerQualifier(run_ts=run_ts)
     
     # Process all YAML files in marker directory
-    marker_path = Path(CONFIG['MARKER_DIR'])
-    
-    if not marker_path.exists():
-        logger.error(f"Marker directory '{CONFIG["MARKER_DIR"]}' does not exist")
-        print(f"Error: Marker directory '{CONFIG["MARKER_DIR"]}' does not exist")
+    if not os.path.exists(CONFIG['MARKER_DIR']):
+        logger.error(f"Marker directory '{CONFIG['MARKER_DIR']}' does not exist")
+        print(f"Error: Marker directory '{CONFIG['MARKER_DIR']}' does not exist")
         print("Please run complete_markers.py first to normalize markers.")
         return
     
-    yaml_files = list(marker_path.glob('*.yaml'))
+    # scandir entries carry the name and file type from the directory listing;
+    # paths stay plain strings and are only wrapped in Path for quarantining
+    with os.scandir(CONFIG['MARKER_DIR']) as it:
+        yaml_files = [e.path for e in it if e.is_file() and e.name.endswith('.yaml')]
     if not yaml_files:
         logger.warning(f"No YAML files found in '{CONFIG['MARKER_DIR']}'")
         print(f"No YAML files found in '{CONFIG['MARKER_DIR']}'")
@@ -354,37 +566,60 @@ def qualify_marker_set():
     
     print(f"Qualifying {len(yaml_files)} markers...")
     
-    for yaml_file in yaml_files:
-        total_files += 1
-        result = qualifier.qualify_marker(yaml_file)
-        
-        if result['status'] == 'QUALIFIED':
-            qualified += 1
-        else:
-            failed += 1
-        
-        # Add to report
-        report_entry = {
-            'file': result['file'],
-            'status': result['status'],
-            'error': 'VALIDATION_ERROR' if result['errors'] else '',
-            'details': f"Score: {result['quality_score']:.1f} ({result['quality_rating']})" 
-                      if result['status'] == 'QUALIFIED' 
-                      else '; '.join(result['errors'][:2])  # First 2 errors
-        }
-        report_data.append(report_entry)
-        
-        # Print progress
-        if total_files % 10 == 0:
-            print(f"Processed {total_files} files...")
+    # Only entries for files seen in this run are written back
+    cache = _load_cache()
+    new_cache = {}
     
-    # Write or append to TSV report
+    # Report rows are written as results come back rather than collected first
     mode = 'a' if CONFIG['APPEND_TO_REPORT'] and os.path.exists(CONFIG['SUMMARY_LOG']) else 'w'
-    with open(CONFIG['SUMMARY_LOG'], mode, encoding='utf-8') as f:
+    with open(CONFIG['SUMMARY_LOG'], mode, encoding='utf-8', buffering=1 << 16) as report_f:
         if mode == 'w':
-            f.write("File\tStatus\tError\tDetails\n")
-        for entry in report_data:
-            f.write(f"{entry['file']}\t{entry['status']}\t{entry['error']}\t{entry['details']}\n")
+            report_f.write("File\tStatus\tError\tDetails\n")
+        
+        # Files are independent and parsing is CPU-bound, so fan out across
+        # processes; quarantine moves are done here as results come back
+        with ProcessPoolExecutor(initializer=_init_qualifier, initargs=(cache,)) as executor:
+            results = executor.map(_qualify_one, yaml_files, chunksize=16)
+            for yaml_file, (result, quarantine_errors) in zip(yaml_files, results):
+                total_files += 1
+                
+                # Processing errors are not cached, so they are retried next run
+                if result['content_hash'] is not None and result['status'] != _ST_ERROR:
+                    new_cache[result['content_hash']] = {
+                        'status': result['status'],
+                        'errors': result['errors'],
+                        'warnings': result['warnings'],
+                        'quality_score': result['quality_score'],
+                        'quality_rating': result['quality_rating'],
+                        'quarantine': quarantine_errors is not None
+                    }
+                
+                if quarantine_errors is not None:
+                    qualifier._quarantine_marker(Path(yaml_file), quarantine_errors)
+                    if result['status'] == _ST_ERROR:
+                        logger.error(f"Error processing {result['file']}: {quarantine_errors[0]}")
+                    else:
+                        logger.error(f"Failed qualification for {result['file']}: {quarantine_errors[0]}")
+                elif result['status'] == _ST_QUALIFIED:
+                    logger.info(f"Qualified {result['file']} - Score: {result['quality_score']:.1f} ({result['quality_rating']})")
+                
+                if result['status'] == _ST_QUALIFIED:
+                    qualified += 1
+                    details = f"Score: {result['quality_score']:.1f} ({result['quality_rating']})"
+                else:
+                    failed += 1
+                    details = '; '.join(result['errors'][:2])  # First 2 errors
+                
+                # Add to report
+                error = 'VALIDATION_ERROR' if result['errors'] else ''
+                report_f.write('\t'.join((result['file'], result['status'], error, details)) + '\n')
+                
+                # Print progress
+                if total_files % 10 == 0:
+                    print(f"Processed {total_files} files...")
+    
+    _save_cache(new_cache)
+    _log_buffer.flush()
     
     # Calculate success rate
     success_rate = (qualified / total_files * 100) if total_files > 0 else 0